@@ -6,20 +6,23 @@ A Flask web application that serves both a dynamic webpage and API endpoints
 for Star Wars-themed timestamp data.
 """
 
+import gzip
 import json
 import os
+import re
 import sys
-from datetime import datetime, timezone
+import threading
+import time
 from pathlib import Path
 
-from flask import Flask, jsonify, render_template, request
+import orjson
+from flask import Flask, Response, jsonify, render_template, request
 from flask_cors import CORS
 
 # Add the holonet-stamp directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'holonet-stamp'))
 
-from holonet_stamp_module import build_payload, _now_utc, _fetch_quote, _final_request_id
-from sw_time import datetime_to_swet, datetime_to_cgt, format_cgt, bby_to_gsc
+from holonet_stamp_module import API_PREFIX, DEFAULT_FACT, build_payload, _now_utc, _fetch_quote, _gen_request_id, _with_prefix, _zi
 
 app = Flask(__name__)
 CORS(app)
@@ -27,33 +30,71 @@ CORS(app)
 # Configuration
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'greedo-secret-key')
 DEFAULT_TZ = "America/Los_Angeles"
+QUOTE_URL = "http://swquotesapi.digitaljedi.dk/api/SWQuote/RandomStarWarsQuote"
+QUOTE_TTL_S = float(os.environ.get('QUOTE_TTL_S', 60))
 
-class DummyArgs:
-    """Dummy args class to work with holonet_stamp functions"""
-    def __init__(self, json_mode=False, quiet=False, one_line=False):
-        self.json = json_mode
-        self.quiet = quiet
-        self.one_line = one_line
-        self.request_id = None
-        self.request_id_mode = "uuid"
-        self.rid_prefix = None
+# Quote cache shared across requests: the quote API is slow relative to the
+# rest of the request, so a fetched quote is reused until it expires. The last
+# good quote is kept around and served if a refresh fails.
+_quote_cache = {"quote": None, "expires": 0.0}
+_quote_lock = threading.Lock()
+
+# Client-supplied request ids are echoed back and forwarded to the quote API,
+# so only short ids made of token-safe characters are accepted.
+_CLIENT_REQUEST_ID_RE = re.compile(r"[A-Za-z0-9._:-]{1,128}")
+
+def _web_request_id(prefix=API_PREFIX):
+    """
+    Request ID for the current web request: the inbound X-Request-ID header
+    if one was sent and looks sane, otherwise a generated id. Prefixed like
+    the CLI does.
+    """
+    rid = request.headers.get("X-Request-ID", "").strip()
+    if _CLIENT_REQUEST_ID_RE.fullmatch(rid):
+        return _with_prefix(rid, prefix)
+    return f"{prefix}{_gen_request_id('uuid')}"
+
+def get_cached_quote(request_id):
+    """Return a quote, hitting the quote API at most once per QUOTE_TTL_S"""
+    if time.monotonic() < _quote_cache["expires"]:
+        return _quote_cache["quote"]
+
+    # Expired: one thread refreshes. The others never wait on the (up to 2s)
+    # fetch; they get whatever is cached, which is None until a fetch has
+    # succeeded, so requests go out without a quote rather than stalling.
+    if not _quote_lock.acquire(blocking=False):
+        return _quote_cache["quote"]
+    try:
+        # Another thread may have finished a refresh since the check above.
+        if time.monotonic() < _quote_cache["expires"]:
+            return _quote_cache["quote"]
+
+        quote = _fetch_quote(QUOTE_URL, request_id, timeout_s=2.0)
+        if quote:
+            _quote_cache["quote"] = quote
+        # Back off for a full TTL on failure too, so a dead quote API doesn't
+        # add its timeout to every request; the stale quote (if any) is served.
+        _quote_cache["expires"] = time.monotonic() + QUOTE_TTL_S
+        return _quote_cache["quote"]
+    finally:
+        _quote_lock.release()
 
 def get_timestamp_data(include_quote=True):
-    """Generate timestamp data using holonet-stamp functionality"""
+    """
+    Generate timestamp data using holonet-stamp functionality.
+
+    Returns (payload, now_utc, local_dt) so text rendering can use the
+    datetimes directly instead of parsing them back out of the payload.
+    """
     now_utc = _now_utc()
     
     # Generate request ID
-    args = DummyArgs(json_mode=True)
-    request_id = _final_request_id(args)
+    request_id = _web_request_id()
     
-    # Fetch quote if requested
+    # Fetch quote if requested (usually a cache hit, see get_cached_quote)
     quote = None
     if include_quote:
-        quote = _fetch_quote(
-            "http://swquotesapi.digitaljedi.dk/api/SWQuote/RandomStarWarsQuote",
-            request_id,
-            timeout_s=2.0
-        )
+        quote = get_cached_quote(request_id)
     
     # Build the payload
     payload = build_payload(
@@ -65,20 +106,19 @@ def get_timestamp_data(include_quote=True):
         quote=quote
     )
     
-    return payload
+    local_dt = now_utc.astimezone(_zi(DEFAULT_TZ))
+    return payload, now_utc, local_dt
 
-def format_text_response(payload):
+def format_text_response(payload, dt_utc, dt_local):
     """Format the payload as text for the cURL endpoint"""
-    dt_utc = datetime.fromisoformat(payload["time"]["utc"].replace("Z", "+00:00"))
-    dt_local = datetime.fromisoformat(payload["time"]["local"])
-    unix = payload["unix"]
+    unix = payload.unix
     
     lines = [
-        f"Fact: {payload['fact']}"
+        f"Fact: {payload.fact}"
     ]
     
-    if "quote" in payload and payload["quote"]:
-        lines.append(f"Rando Factissian: {payload['quote']}")
+    if payload.quote:
+        lines.append(f"Rando Factissian: {payload.quote}")
     
     lines.extend([
         "",
@@ -90,8 +130,8 @@ def format_text_response(payload):
         f"  Unix  : {unix}",
     ])
     
-    if "sw" in payload:
-        sw = payload["sw"]
+    sw = payload.sw
+    if sw is not None:
         lines.extend([
             "",
             "Star Wars Time:",
@@ -112,8 +152,8 @@ def index():
 def api_greedo():
     """JSON API endpoint"""
     try:
-        data = get_timestamp_data(include_quote=True)
-        return jsonify(data)
+        data, _, _ = get_timestamp_data(include_quote=True)
+        return Response(orjson.dumps(data.to_dict()), mimetype='application/json')
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -121,8 +161,8 @@ def api_greedo():
 def curl_greedo():
     """Text-based cURL endpoint"""
     try:
-        data = get_timestamp_data(include_quote=True)
-        return format_text_response(data), 200, {'Content-Type': 'text/plain'}
+        data, now_utc, local_dt = get_timestamp_data(include_quote=True)
+        return format_text_response(data, now_utc, local_dt), 200, {'Content-Type': 'text/plain'}
     except Exception as e:
         return f"Error: {str(e)}", 500, {'Content-Type': 'text/plain'}
 
@@ -136,26 +176,29 @@ def about():
     """About page with SWET information"""
     return render_template('about.html')
 
+# Everything in the health response except the timestamp is static, so it is
+# encoded once and the current timestamp is spliced in per request.
+_HEALTH_TIMESTAMP = "__HEALTH_TIMESTAMP__"
+_HEALTH_TEMPLATE = orjson.dumps({
+    "status": "healthy",
+    "timestamp": _HEALTH_TIMESTAMP,
+    "version": "1.0.0",
+    "service": "gree.do",
+    "endpoints": {
+        "/api/v1/greedo": "JSON timestamp data",
+        "/curl/v1/greedo": "Text timestamp data", 
+        "/health": "Health check page",
+        "/about": "About SWET and Star Wars time"
+    },
+    "fact": DEFAULT_FACT
+})
+
 @app.route('/api/health')
 def api_health():
     """API health check with JSON response"""
-    now_utc = _now_utc()
-    
-    health_data = {
-        "status": "healthy",
-        "timestamp": now_utc.isoformat(),
-        "version": "1.0.0",
-        "service": "gree.do",
-        "endpoints": {
-            "/api/v1/greedo": "JSON timestamp data",
-            "/curl/v1/greedo": "Text timestamp data", 
-            "/health": "Health check page",
-            "/about": "About SWET and Star Wars time"
-        },
-        "fact": "Han shot first."
-    }
-    
-    return jsonify(health_data)
+    timestamp = orjson.dumps(_now_utc().isoformat())
+    body = _HEALTH_TEMPLATE.replace(orjson.dumps(_HEALTH_TIMESTAMP), timestamp, 1)
+    return Response(body, mimetype='application/json')
 
 @app.route('/docs')
 def swagger_docs():
@@ -167,54 +210,55 @@ def redoc_docs():
     """ReDoc API documentation"""
     return render_template('redoc.html')
 
-@app.route('/openapi.json')
-def openapi_spec():
-    """OpenAPI specification"""
-    spec = {
-        "openapi": "3.0.0",
-        "info": {
-            "title": "Gree.do API",
-            "description": "Star Wars Holonet Timestamp System API",
-            "version": "1.0.0",
-            "contact": {
-                "name": "Gree.do",
-                "url": "https://github.com/pbertain/greedo"
-            }
-        },
-        "servers": [
-            {"url": request.url_root.rstrip('/'), "description": "Current server"}
-        ],
-        "paths": {
-            "/api/v1/greedo": {
-                "get": {
-                    "summary": "Get timestamp data (JSON)",
-                    "description": "Returns current timestamp data in JSON format with Star Wars time systems",
-                    "responses": {
-                        "200": {
-                            "description": "Successful response",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "fact": {"type": "string"},
-                                            "quote": {"type": "string"},
-                                            "time": {
-                                                "type": "object",
-                                                "properties": {
-                                                    "utc": {"type": "string"},
-                                                    "local": {"type": "string"},
-                                                    "tz": {"type": "string"}
-                                                }
-                                            },
-                                            "unix": {"type": "integer"},
-                                            "sw": {
-                                                "type": "object",
-                                                "properties": {
-                                                    "swet": {"type": "integer"},
-                                                    "cgt_str": {"type": "string"},
-                                                    "gsc_year": {"type": "integer"}
-                                                }
+# Server URL advertised in the spec. Fixed rather than taken from the request
+# Host header, so the spec is fully static; the default "/" is resolved by
+# clients against whichever host served /openapi.json.
+OPENAPI_SERVER_URL = os.environ.get('OPENAPI_SERVER_URL', '/')
+
+OPENAPI_SPEC = {
+    "openapi": "3.0.0",
+    "info": {
+        "title": "Gree.do API",
+        "description": "Star Wars Holonet Timestamp System API",
+        "version": "1.0.0",
+        "contact": {
+            "name": "Gree.do",
+            "url": "https://github.com/pbertain/greedo"
+        }
+    },
+    "servers": [
+        {"url": OPENAPI_SERVER_URL, "description": "Current server"}
+    ],
+    "paths": {
+        "/api/v1/greedo": {
+            "get": {
+                "summary": "Get timestamp data (JSON)",
+                "description": "Returns current timestamp data in JSON format with Star Wars time systems",
+                "responses": {
+                    "200": {
+                        "description": "Successful response",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "fact": {"type": "string"},
+                                        "quote": {"type": "string"},
+                                        "time": {
+                                            "type": "object",
+                                            "properties": {
+                                                "utc": {"type": "string"},
+                                                "local": {"type": "string"},
+                                                "tz": {"type": "string"}
+                                            }
+                                        },
+                                        "unix": {"type": "integer"},
+                                        "sw": {
+                                            "type": "object",
+                                            "properties": {
+                                                "swet": {"type": "integer"},
+                                                "cgt_str": {"type": "string"},
+                                                "gsc_year": {"type": "integer"}
                                             }
                                         }
                                     }
@@ -223,19 +267,19 @@ def openapi_spec():
                         }
                     }
                 }
-            },
-            "/curl/v1/greedo": {
-                "get": {
-                    "summary": "Get timestamp data (Text)",
-                    "description": "Returns current timestamp data in plain text format for cURL usage",
-                    "responses": {
-                        "200": {
-                            "description": "Successful response",
-                            "content": {
-                                "text/plain": {
-                                    "schema": {
-                                        "type": "string"
-                                    }
+            }
+        },
+        "/curl/v1/greedo": {
+            "get": {
+                "summary": "Get timestamp data (Text)",
+                "description": "Returns current timestamp data in plain text format for cURL usage",
+                "responses": {
+                    "200": {
+                        "description": "Successful response",
+                        "content": {
+                            "text/plain": {
+                                "schema": {
+                                    "type": "string"
                                 }
                             }
                         }
@@ -244,9 +288,28 @@ def openapi_spec():
             }
         }
     }
-    return jsonify(spec)
+}
+
+# Serialized and gzipped once at import.
+_OPENAPI_BODY = json.dumps(OPENAPI_SPEC, sort_keys=True, separators=(",", ":")).encode()
+_OPENAPI_BODY_GZ = gzip.compress(_OPENAPI_BODY, compresslevel=6)
+
+@app.route('/openapi.json')
+def openapi_spec():
+    """OpenAPI specification"""
+    if request.accept_encodings.quality('gzip') > 0:
+        response = Response(_OPENAPI_BODY_GZ, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(_OPENAPI_BODY, mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    return response
 
 if __name__ == '__main__':
-    port = int(os.environ.get('PORT', 5000))
+    # The Werkzeug dev server is for local debugging only; production runs
+    # under Gunicorn (see gunicorn_conf.py).
     debug = os.environ.get('DEBUG', 'False').lower() == 'true'
-    app.run(host='0.0.0.0', port=port, debug=debug)
\ No newline at end of file
+    if not debug:
+        sys.exit("Use 'gunicorn app:app -c gunicorn_conf.py' (or set DEBUG=true for the dev server)")
+    port = int(os.environ.get('PORT', 5000))
+    app.run(host='0.0.0.0', port=port, debug=debug)
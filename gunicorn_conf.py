@@ -0,0 +1,22 @@
+"""
+Gunicorn configuration for Gree.do
+
+Usage:
+    gunicorn app:app -c gunicorn_conf.py
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# Threaded workers: requests that wait on the quote API don't hold up others
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = "gthread"
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+timeout = 30
+
+# Log to stdout/stderr so systemd's journal picks everything up
+accesslog = "-"
+errorlog = "-"
+loglevel = os.environ.get('LOG_LEVEL', 'info').lower()
@@ -1,3 +1,3 @@
 # Make holonet-stamp a proper Python package
-from .holonet_stamp_module import build_payload, _now_utc, _fetch_quote, _final_request_id
+from .holonet_stamp_module import Payload, build_payload, _now_utc, _fetch_quote, _final_request_id
 from . import sw_time
\ No newline at end of file
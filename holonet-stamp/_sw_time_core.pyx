@@ -0,0 +1,57 @@
+# cython: language_level=3, cdivision=True
+"""
+_sw_time_core.pyx — optional C build of the integer CGT arithmetic in sw_time.py.
+
+sw_time picks these up when the extension is compiled (see setup.py) and
+otherwise falls back to its numba / pure-Python versions. The constants and
+floor semantics here must match sw_time exactly.
+"""
+
+cdef long long SECONDS_PER_MINUTE = 60
+cdef long long SECONDS_PER_HOUR = 60 * 60
+cdef long long SECONDS_PER_DAY = 24 * 60 * 60
+cdef long long DAYS_PER_CGT_YEAR = 365
+cdef long long SECONDS_PER_CGT_YEAR = DAYS_PER_CGT_YEAR * SECONDS_PER_DAY
+
+
+cdef inline void _floor_divmod(long long a, long long b, long long *q, long long *r) noexcept nogil:
+    # cdivision truncates toward zero; shift to Python's floor semantics (b > 0).
+    q[0] = a // b
+    r[0] = a % b
+    if r[0] < 0:
+        r[0] += b
+        q[0] -= 1
+
+
+cdef inline long long cgt_to_seconds_c(
+    long long year, long long day, long long hour, long long minute, long long second
+) noexcept nogil:
+    return (
+        year * SECONDS_PER_CGT_YEAR
+        + (day - 1) * SECONDS_PER_DAY
+        + hour * SECONDS_PER_HOUR
+        + minute * SECONDS_PER_MINUTE
+        + second
+    )
+
+
+cdef inline void seconds_to_cgt_c(long long cgt_seconds, long long *out) noexcept nogil:
+    # out: [year, day, hour, minute, second]
+    cdef long long t
+    _floor_divmod(cgt_seconds, SECONDS_PER_MINUTE, &t, &out[4])
+    _floor_divmod(t, 60, &t, &out[3])
+    _floor_divmod(t, 24, &t, &out[2])
+    _floor_divmod(t, DAYS_PER_CGT_YEAR, &out[0], &out[1])
+    out[1] += 1
+
+
+def cgt_fields_to_seconds(long long year, long long day, long long hour, long long minute, long long second):
+    """C version of sw_time._cgt_fields_to_seconds."""
+    return cgt_to_seconds_c(year, day, hour, minute, second)
+
+
+def cgt_fields_from_seconds(long long cgt_seconds):
+    """C version of sw_time._cgt_fields_from_seconds: (year, day, hour, minute, second)."""
+    cdef long long out[5]
+    seconds_to_cgt_c(cgt_seconds, out)
+    return out[0], out[1], out[2], out[3], out[4]
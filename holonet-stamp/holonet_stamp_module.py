@@ -27,25 +27,36 @@ import json
 import os
 import secrets
 import sys
+import threading
 import urllib.request
-import uuid
-from dataclasses import asdict
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
-from zoneinfo import ZoneInfo
+try:  # optional: pooled keep-alive connections for the quote API
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
 
 from sw_time import (
+    GSC_OFFSET,
     STAR_WARS_RELEASE_UNIX,
-    bby_to_gsc,
-    datetime_to_cgt,
-    datetime_to_swet,
+    _zi,
     format_cgt,
+    unix_to_cgt,
+    unix_to_swet,
 )
 
 DEFAULT_TZ = "America/Los_Angeles"
-DEFAULT_FACT = "Han shot first."
+# The fact and request-id prefix constants are sys.intern'd.
+DEFAULT_FACT = sys.intern("Han shot first.")
+API_PREFIX = sys.intern("api-")
+CURL_PREFIX = sys.intern("curl-")
+WEB_PREFIX = sys.intern("web-")
 DEFAULT_QUOTE_URL = "http://swquotesapi.digitaljedi.dk/api/SWQuote/RandomStarWarsQuote"
+SWET_AT_UNIX_EPOCH = -STAR_WARS_RELEASE_UNIX
 
 # Common env var names seen behind proxies / gateways
 ENV_X_REQUEST_ID_CANDIDATES = (
@@ -72,7 +83,10 @@ class Ansi:
     FG_MAGENTA = "\033[35m"
 
 
+@lru_cache(maxsize=4)
 def _supports_color(stream) -> bool:
+    # Env and TTY status don't change for a given stream during a run,
+    # so the answer is computed once per stream.
     if os.environ.get("NO_COLOR"):
         return False
     if os.environ.get("TERM", "") in ("", "dumb"):
@@ -115,11 +129,13 @@ def _read_inbound_x_request_id() -> Optional[str]:
 def _gen_request_id(mode: str) -> str:
     """
     Generate a request id.
-    - uuid: UUIDv4
+    - uuid: 128 random bits in UUID layout (8-4-4-4-12 hex)
     - short: url-safe short id (12 chars)
     """
     if mode == "uuid":
-        return str(uuid.uuid4())
+        # Same shape and entropy as str(uuid.uuid4()) without building a UUID object.
+        h = secrets.token_hex(16)
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
     if mode == "short":
         return secrets.token_urlsafe(9)[:12]
     raise ValueError(f"Unknown request-id mode: {mode!r}")
@@ -135,10 +151,26 @@ def _auto_prefix(args: argparse.Namespace) -> str:
     - Else: treat as web UI-ish => "web-"
     """
     if args.json:
-        return "api-"
+        return API_PREFIX
     if args.quiet or args.one_line:
-        return "curl-"
-    return "web-"
+        return CURL_PREFIX
+    return WEB_PREFIX
+
+
+# Prefixes the auto-detection hands out; ids already carrying one are kept.
+_KNOWN_PREFIXES = (API_PREFIX, CURL_PREFIX, WEB_PREFIX)
+
+
+def _with_prefix(rid: str, prefix: str, keep_known: bool = True) -> str:
+    # If caller supplied an id and also a prefix, don't double-prefix.
+    # Only prefix if rid doesn't already begin with prefix. With keep_known
+    # (the prefix was auto-detected, not asked for) ids carrying any known
+    # prefix are left alone too; tuple startswith checks them all at once.
+    if not prefix or rid.startswith(prefix):
+        return rid
+    if keep_known and rid.startswith(_KNOWN_PREFIXES):
+        return rid
+    return f"{prefix}{rid}"
 
 
 def _final_request_id(args: argparse.Namespace) -> str:
@@ -148,17 +180,17 @@ def _final_request_id(args: argparse.Namespace) -> str:
     2) inbound X-Request-ID from env
     3) auto-generated (with prefix)
     """
-    rid = args.request_id or _read_inbound_x_request_id()
-    prefix = args.rid_prefix if args.rid_prefix is not None else _auto_prefix(args)
+    auto = args.rid_prefix is None
+    prefix = _auto_prefix(args) if auto else args.rid_prefix
     # Normalize prefix: allow empty; ensure it ends with '-' if non-empty and not already.
     if prefix and not prefix.endswith("-"):
         prefix = prefix + "-"
+    if args.request_id:
+        # Explicit id: never scan the environment or generate a random id.
+        return _with_prefix(args.request_id, prefix, keep_known=auto)
+    rid = _read_inbound_x_request_id()
     if rid:
-        # If caller supplied an id and also a prefix, don't double-prefix.
-        # Only prefix if rid doesn't already begin with prefix.
-        if prefix and not rid.startswith(prefix):
-            return f"{prefix}{rid}"
-        return rid
+        return _with_prefix(rid, prefix, keep_known=auto)
     return f"{prefix}{_gen_request_id(args.request_id_mode)}"
 
 
@@ -182,6 +214,30 @@ def _pick_fact(extra_facts: list[str], unix: int) -> Optional[str]:
     return extra_facts[idx]
 
 
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session():
+    """
+    Lazily create the shared HTTP session (None if requests isn't installed).
+    Reusing it keeps connections alive between quote fetches in long-running
+    processes; requests.Session is safe to share across threads.
+    """
+    global _session
+    if requests is None:
+        return None
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
 def _fetch_quote(url: str, request_id: str, timeout_s: float = 1.5) -> Optional[str]:
     """
     Fetch a random Star Wars quote. If it fails, return None.
@@ -192,10 +248,14 @@ def _fetch_quote(url: str, request_id: str, timeout_s: float = 1.5) -> Optional[
             "User-Agent": "holonet-stamp/1.0",
             "X-Request-ID": request_id,
         }
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=timeout_s) as resp:
-            raw = resp.read().decode("utf-8", errors="replace")
-        data = json.loads(raw)
+        session = _get_session()
+        if session is not None:
+            data = session.get(url, headers=headers, timeout=timeout_s).json()
+        else:
+            req = urllib.request.Request(url, headers=headers)
+            with urllib.request.urlopen(req, timeout=timeout_s) as resp:
+                raw = resp.read().decode("utf-8", errors="replace")
+            data = json.loads(raw)
         quote = data.get("starWarsQuote")
         if isinstance(quote, str) and quote.strip():
             return quote.strip()
@@ -212,6 +272,41 @@ def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
+@dataclass
+class Payload:
+    """
+    One stamp. Renderers read attributes (slot loads, not dict lookups);
+    to_dict() produces the JSON shape at the serialization boundary.
+    Optional fields are None when absent.
+    """
+    __slots__ = ("request_id", "x_request_id", "fact", "time", "unix", "extra_fact", "quote", "sw")
+
+    request_id: str
+    x_request_id: str  # explicitly called out for headers/logging symmetry
+    fact: str          # always present
+    time: Dict[str, str]
+    unix: int
+    extra_fact: Optional[str]
+    quote: Optional[str]
+    sw: Optional[Dict[str, Any]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        d: Dict[str, Any] = {
+            "request_id": self.request_id,
+            "x_request_id": self.x_request_id,
+            "fact": self.fact,
+            "time": self.time,
+            "unix": self.unix,
+        }
+        if self.extra_fact:
+            d["extra_fact"] = self.extra_fact
+        if self.quote:
+            d["quote"] = self.quote
+        if self.sw is not None:
+            d["sw"] = self.sw
+        return d
+
+
 def build_payload(
     now_utc: datetime,
     tz_name: str,
@@ -220,76 +315,92 @@ def build_payload(
     request_id: str,
     quote: Optional[str] = None,
     extra_fact: Optional[str] = None,
-) -> Dict[str, Any]:
+) -> Payload:
     unix = int(now_utc.timestamp())
-
-    payload: Dict[str, Any] = {
-        "request_id": request_id,
-        "x_request_id": request_id,  # explicitly called out for headers/logging symmetry
-        "fact": DEFAULT_FACT,        # always present
-        "time": {
+    return Payload(
+        request_id=request_id,
+        x_request_id=request_id,
+        fact=DEFAULT_FACT,
+        time={
             "utc": now_utc.isoformat().replace("+00:00", "Z"),
-            "local": now_utc.astimezone(ZoneInfo(tz_name)).isoformat(),
+            "local": now_utc.astimezone(_zi(tz_name)).isoformat(),
             "tz": tz_name,
         },
-        "unix": unix,
+        unix=unix,
+        extra_fact=extra_fact or None,
+        quote=quote or None,
+        sw=_sw_block(unix, epoch_mode) if include_sw else None,
+    )
+
+
+def _sw_block(unix: int, epoch_mode: str) -> Dict[str, Any]:
+    """Star Wars time block for build_payload (only built when requested)."""
+    cgt = unix_to_cgt(unix, mode=epoch_mode)
+    return {
+        "swet": unix_to_swet(unix),
+        "cgt": {
+            "year": cgt.year,
+            "day": cgt.day,
+            "hour": cgt.hour,
+            "minute": cgt.minute,
+            "second": cgt.second,
+        },
+        "cgt_str": format_cgt(cgt),
+        # GSC is year-only; we map CGT.year -> a year label for context
+        "gsc_year": cgt.year + GSC_OFFSET,
+        "cgt_epoch_mode": epoch_mode,
+        "swet_at_unix_epoch": SWET_AT_UNIX_EPOCH,
     }
 
-    if extra_fact:
-        payload["extra_fact"] = extra_fact
-    if quote:
-        payload["quote"] = quote
-
-    if include_sw:
-        swet = datetime_to_swet(now_utc)
-        cgt = datetime_to_cgt(now_utc, mode=epoch_mode)
-
-        payload["sw"] = {
-            "swet": swet,
-            "cgt": asdict(cgt),
-            "cgt_str": format_cgt(cgt),
-            # GSC is year-only; we map CGT.year -> a year label for context
-            "gsc_year": bby_to_gsc(cgt.year),
-            "cgt_epoch_mode": epoch_mode,
-            "swet_at_unix_epoch": -STAR_WARS_RELEASE_UNIX,
-        }
 
-    return payload
-
-
-def render_one_line(payload: Dict[str, Any]) -> str:
-    dt_utc = datetime.fromisoformat(payload["time"]["utc"].replace("Z", "+00:00"))
-    unix = payload["unix"]
-    local_dt = datetime.fromisoformat(payload["time"]["local"])
-    tz_name = payload["time"]["tz"]
-    rid = payload["request_id"]
-
-    parts = [
-        f"rid={rid}",
-        f'fact="{payload["fact"]}"',
-        f"utc={dt_utc:%Y-%m-%dT%H:%M:%SZ}",
-        f"unix={unix}",
-        f"local={local_dt:%Y-%m-%dT%H:%M:%S}{local_dt:%z}",
-        f"tz={tz_name}",
-    ]
-    if "extra_fact" in payload:
-        parts.append(f'extra_fact="{payload["extra_fact"]}"')
-    if "quote" in payload:
-        parts.append(f'quote="{payload["quote"]}"')
-    if "sw" in payload:
-        sw = payload["sw"]
-        parts.append(f"swet={sw['swet']}")
-        parts.append(f'cgt="{sw["cgt_str"]}"')
-        parts.append(f"gsc={sw['gsc_year']}")
-        parts.append(f"mode={sw['cgt_epoch_mode']}")
-    return " ".join(parts)
-
-
-def render_pretty_text(payload: Dict[str, Any], color: bool, banner: bool) -> str:
-    dt_utc = datetime.fromisoformat(payload["time"]["utc"].replace("Z", "+00:00"))
-    dt_local = datetime.fromisoformat(payload["time"]["local"])
-    unix = payload["unix"]
-    rid = payload["request_id"]
+def _payload_datetimes(payload: Payload) -> tuple[datetime, datetime]:
+    """
+    Recover (utc, local) datetimes from a payload's ISO strings.
+    Callers that still hold the datetimes should pass them to the renderers instead.
+    """
+    dt_utc = datetime.fromisoformat(payload.time["utc"].replace("Z", "+00:00"))
+    dt_local = datetime.fromisoformat(payload.time["local"])
+    return dt_utc, dt_local
+
+
+def render_one_line(
+    payload: Payload,
+    dt_utc: Optional[datetime] = None,
+    dt_local: Optional[datetime] = None,
+) -> str:
+    if dt_utc is None or dt_local is None:
+        dt_utc, dt_local = _payload_datetimes(payload)
+    unix = payload.unix
+    tz_name = payload.time["tz"]
+    rid = payload.request_id
+
+    # Optional segments carry their own leading space so the whole line is
+    # built by one f-string, with no intermediate list.
+    extra = f' extra_fact="{payload.extra_fact}"' if payload.extra_fact else ""
+    quote = f' quote="{payload.quote}"' if payload.quote else ""
+    sw = payload.sw
+    sw_part = (
+        f' swet={sw["swet"]} cgt="{sw["cgt_str"]}" gsc={sw["gsc_year"]} mode={sw["cgt_epoch_mode"]}'
+        if sw is not None
+        else ""
+    )
+    return (
+        f'rid={rid} fact="{payload.fact}" utc={dt_utc:%Y-%m-%dT%H:%M:%SZ} unix={unix} '
+        f"local={dt_local:%Y-%m-%dT%H:%M:%S}{dt_local:%z} tz={tz_name}{extra}{quote}{sw_part}"
+    )
+
+
+def render_pretty_text(
+    payload: Payload,
+    color: bool,
+    banner: bool,
+    dt_utc: Optional[datetime] = None,
+    dt_local: Optional[datetime] = None,
+) -> str:
+    if dt_utc is None or dt_local is None:
+        dt_utc, dt_local = _payload_datetimes(payload)
+    unix = payload.unix
+    rid = payload.request_id
 
     out = []
     if banner:
@@ -298,11 +409,11 @@ def render_pretty_text(payload: Dict[str, Any], color: bool, banner: bool) -> st
 
     out.append(f"{_c('Request', Ansi.BOLD, color)}: {rid}")
     out.append(f"{_c('X-Request-ID', Ansi.DIM, color)}: {rid}")
-    out.append(f"{_c('Fact', Ansi.BOLD, color)}: {payload['fact']}")
-    if "extra_fact" in payload:
-        out.append(f"{_c('Extra', Ansi.BOLD, color)}: {payload['extra_fact']}")
-    if "quote" in payload:
-        out.append(f"{_c('Quote', Ansi.BOLD, color)}: {payload['quote']}")
+    out.append(f"{_c('Fact', Ansi.BOLD, color)}: {payload.fact}")
+    if payload.extra_fact:
+        out.append(f"{_c('Extra', Ansi.BOLD, color)}: {payload.extra_fact}")
+    if payload.quote:
+        out.append(f"{_c('Quote', Ansi.BOLD, color)}: {payload.quote}")
     out.append("")
 
     out.append(_c("Real Time:", Ansi.FG_GREEN, color))
@@ -314,8 +425,8 @@ def render_pretty_text(payload: Dict[str, Any], color: bool, banner: bool) -> st
     out.append(f"  Unix  : {unix}")
     out.append("")
 
-    if "sw" in payload:
-        sw = payload["sw"]
+    sw = payload.sw
+    if sw is not None:
         out.append(_c("Star Wars Time:", Ansi.FG_MAGENTA, color))
         out.append(f"  SWET  : {sw['swet']}")
         out.append(f"  CGT   : {sw['cgt_str']}")
@@ -394,20 +505,22 @@ def main(argv: list[str]) -> int:
     if args.json:
         compact = args.one_line or args.quiet
         txt = json.dumps(
-            payload,
+            payload.to_dict(),
             indent=None if compact else 2,
             separators=(",", ":") if compact else None,
         )
         print(txt)
         return 0
 
+    dt_local = now_utc.astimezone(_zi(args.tz))
+
     if args.quiet or args.one_line:
-        print(render_one_line(payload))
+        print(render_one_line(payload, dt_utc=now_utc, dt_local=dt_local))
         return 0
 
     color = (not args.no_color) and _supports_color(sys.stdout)
     banner = not args.no_banner
-    print(render_pretty_text(payload, color=color, banner=banner))
+    print(render_pretty_text(payload, color=color, banner=banner, dt_utc=now_utc, dt_local=dt_local))
     return 0
 
 
@@ -0,0 +1,16 @@
+"""
+Build hook for the optional C extension.
+
+Project metadata lives in pyproject.toml; this only adds _sw_time_core (the
+Cython build of sw_time's integer CGT core). It is marked optional, so an
+install without a working C compiler still succeeds and sw_time falls back to
+its pure-Python code.
+"""
+
+from setuptools import Extension, setup
+
+setup(
+    ext_modules=[
+        Extension("_sw_time_core", ["_sw_time_core.pyx"], optional=True),
+    ],
+)
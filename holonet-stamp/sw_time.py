@@ -18,10 +18,19 @@ Requires: Python 3.9+ (zoneinfo)
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from zoneinfo import ZoneInfo
-from typing import Literal
+from typing import Literal, NamedTuple, Optional
+
+try:  # optional: C build of the integer CGT core (_sw_time_core.pyx, see setup.py)
+    import _sw_time_core
+except ImportError:
+    _sw_time_core = None
+
+# optional: numpy for the vectorized *_array helpers. Imported on first use by
+# _require_numpy so plain `import sw_time` doesn't pay for it.
+_np = None
 
 # -----------------------------
 # Types / constants
@@ -47,77 +56,158 @@ STAR_WARS_RELEASE_UTC = datetime(1977, 5, 25, 0, 0, 0, tzinfo=timezone.utc)
 STAR_WARS_RELEASE_UNIX = int(STAR_WARS_RELEASE_UTC.timestamp())  # 233_366_400
 
 
+# Cached IANA tz name -> ZoneInfo resolver, shared with holonet_stamp.
+_zi = lru_cache(maxsize=32)(ZoneInfo)
+
+# Zone names that are plain UTC, where no tz conversion is needed.
+_UTC_TZ_NAMES = frozenset({"UTC", "Etc/UTC"})
+
+
+_EPOCH_OFFSETS = {
+    "current": CGT_EPOCH_OFFSET_CURRENT,
+    "legacy": CGT_EPOCH_OFFSET_LEGACY,
+}
+
+
 def _epoch_offset(mode: EpochMode) -> int:
-    if mode == "current":
-        return CGT_EPOCH_OFFSET_CURRENT
-    if mode == "legacy":
-        return CGT_EPOCH_OFFSET_LEGACY
-    raise ValueError(f"Unknown epoch mode: {mode!r}")
+    try:
+        return _EPOCH_OFFSETS[mode]
+    except KeyError:
+        raise ValueError(f"Unknown epoch mode: {mode!r}") from None
 
 
 # -----------------------------
 # CGT data model
 # -----------------------------
 
-@dataclass(frozen=True)
-class CGT:
-    """CGT timestamp: (year, day-of-year 1..365, hour, minute, second)."""
+class _CGTFields(NamedTuple):
     year: int
     day: int
     hour: int
     minute: int
     second: int
 
-    def __post_init__(self) -> None:
-        if not (1 <= self.day <= 365):
-            raise ValueError(f"CGT.day must be 1..365, got {self.day}")
-        if not (0 <= self.hour <= 23):
-            raise ValueError(f"CGT.hour must be 0..23, got {self.hour}")
-        if not (0 <= self.minute <= 59):
-            raise ValueError(f"CGT.minute must be 0..59, got {self.minute}")
-        if not (0 <= self.second <= 59):
-            raise ValueError(f"CGT.second must be 0..59, got {self.second}")
+
+class CGT(_CGTFields):
+    """
+    CGT timestamp: (year, day-of-year 1..365, hour, minute, second).
+    A tuple underneath: cheap to build, hash and compare.
+    """
+    __slots__ = ()
+
+    def __new__(cls, year: int, day: int, hour: int, minute: int, second: int) -> CGT:
+        if not (1 <= day <= 365):
+            raise ValueError(f"CGT.day must be 1..365, got {day}")
+        if not (0 <= hour <= 23):
+            raise ValueError(f"CGT.hour must be 0..23, got {hour}")
+        if not (0 <= minute <= 59):
+            raise ValueError(f"CGT.minute must be 0..59, got {minute}")
+        if not (0 <= second <= 59):
+            raise ValueError(f"CGT.second must be 0..59, got {second}")
+        return tuple.__new__(cls, (year, day, hour, minute, second))
+
+    @classmethod
+    def _unchecked(cls, year: int, day: int, hour: int, minute: int, second: int) -> CGT:
+        """
+        Build a CGT without the range checks in __new__.
+        Only for fields that are in range by construction (e.g. _cgt_from_seconds).
+        """
+        return tuple.__new__(cls, (year, day, hour, minute, second))
+
+    @classmethod
+    def _make(cls, iterable) -> CGT:
+        # NamedTuple's _make (and _replace, which calls it) bypass __new__;
+        # route them through it so only _unchecked skips validation.
+        return cls(*iterable)
 
     def to_cgt_seconds(self) -> int:
         """
         Convert CGT fields to "CGT seconds" as in the JS:
           year*365days + (day-1)*1day + time-of-day.
         """
-        return (
-            int(self.year) * SECONDS_PER_CGT_YEAR
-            + int(self.day - 1) * SECONDS_PER_DAY
-            + int(self.hour) * SECONDS_PER_HOUR
-            + int(self.minute) * SECONDS_PER_MINUTE
-            + int(self.second)
+        return _cgt_fields_to_seconds(
+            int(self.year), int(self.day), int(self.hour), int(self.minute), int(self.second)
         )
 
 
-def _cgt_from_seconds(cgt_seconds: int) -> CGT:
+# The two helpers below are pure integer arithmetic (datetime handling stays in
+# plain Python), so unix_to_cgt_array can JIT-compile them for batch use. The
+# scalar per-request path calls them as plain Python: numba's dispatcher would
+# cost more than the arithmetic for a single call.
+
+def _cgt_fields_to_seconds(year: int, day: int, hour: int, minute: int, second: int) -> int:
+    return (
+        year * SECONDS_PER_CGT_YEAR
+        + (day - 1) * SECONDS_PER_DAY
+        + hour * SECONDS_PER_HOUR
+        + minute * SECONDS_PER_MINUTE
+        + second
+    )
+
+
+def _cgt_fields_from_seconds(cgt_seconds: int) -> tuple[int, int, int, int, int]:
     """
-    Deterministic decomposition of seconds into CGT fields (supports negatives).
+    Deterministic decomposition of seconds into (year, day, hour, minute, second)
+    (supports negatives).
     """
-    total_days = cgt_seconds // SECONDS_PER_DAY  # floor division
-    sod = cgt_seconds - total_days * SECONDS_PER_DAY  # 0..86399
+    # Floor divmod cascade: no branches, and every remainder is non-negative
+    # even for negative inputs.
+    t, second = divmod(cgt_seconds, SECONDS_PER_MINUTE)
+    t, minute = divmod(t, 60)
+    t, hour = divmod(t, 24)
+    year, doy0 = divmod(t, DAYS_PER_CGT_YEAR)  # doy0: 0..364
+    day = doy0 + 1
+    return year, day, hour, minute, second
 
-    hour = sod // SECONDS_PER_HOUR
-    minute = (sod // SECONDS_PER_MINUTE) % 60
-    second = sod % 60
 
-    doy0 = total_days % DAYS_PER_CGT_YEAR  # 0..364
-    day = doy0 + 1
+# Kept for numba, which compiles from the Python source.
+_py_cgt_fields_from_seconds = _cgt_fields_from_seconds
 
-    year = total_days // DAYS_PER_CGT_YEAR
-    return CGT(year=year, day=day, hour=hour, minute=minute, second=second)
+if _sw_time_core is not None:
+    # Prefer the compiled versions when the extension has been built.
+    _cgt_fields_to_seconds = _sw_time_core.cgt_fields_to_seconds
+    _cgt_fields_from_seconds = _sw_time_core.cgt_fields_from_seconds
+
+
+def _cgt_from_seconds(cgt_seconds: int) -> CGT:
+    """
+    Deterministic decomposition of seconds into CGT fields (supports negatives).
+    """
+    # Floor division/modulo keep every field in range, so skip validation.
+    return CGT._unchecked(*_cgt_fields_from_seconds(cgt_seconds))
 
 
 # -----------------------------
 # CGT <-> datetime (UTC / tz)
 # -----------------------------
 
+# All conversions below work in integer Unix seconds against the precomputed
+# epoch offsets; datetimes are only built (or read) at the edges.
+
+def _unix_seconds(dt: datetime) -> int:
+    """
+    datetime -> whole Unix seconds.
+    - If dt is timezone-aware, timestamp() already accounts for its offset.
+    - If dt is naive, treated as UTC.
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def cgt_to_unix(cgt: CGT, mode: EpochMode = "current") -> int:
+    """CGT -> Unix seconds."""
+    return cgt.to_cgt_seconds() + _epoch_offset(mode)
+
+
+def unix_to_cgt(unix: int, mode: EpochMode = "current") -> CGT:
+    """Unix seconds -> CGT (skips datetime handling entirely)."""
+    return _cgt_from_seconds(unix - _epoch_offset(mode))
+
+
 def cgt_to_datetime_utc(cgt: CGT, mode: EpochMode = "current") -> datetime:
     """CGT -> UTC datetime."""
-    unix_seconds = cgt.to_cgt_seconds() + _epoch_offset(mode)
-    return datetime.fromtimestamp(unix_seconds, tz=timezone.utc)
+    return datetime.fromtimestamp(cgt_to_unix(cgt, mode=mode), tz=timezone.utc)
 
 
 def datetime_to_cgt(dt: datetime, mode: EpochMode = "current") -> CGT:
@@ -126,23 +216,19 @@ def datetime_to_cgt(dt: datetime, mode: EpochMode = "current") -> CGT:
     - If dt is timezone-aware, converted to UTC.
     - If dt is naive, treated as UTC.
     """
-    if dt.tzinfo is None:
-        dt_utc = dt.replace(tzinfo=timezone.utc)
-    else:
-        dt_utc = dt.astimezone(timezone.utc)
-
-    unix_seconds = int(dt_utc.timestamp())
-    cgt_seconds = unix_seconds - _epoch_offset(mode)
-    return _cgt_from_seconds(cgt_seconds)
+    return unix_to_cgt(_unix_seconds(dt), mode=mode)
 
 
-def cgt_to_timezone(cgt: CGT, tz_name: str, mode: EpochMode = "current") -> datetime:
+def cgt_to_timezone(cgt: CGT, tz_name: Optional[str], mode: EpochMode = "current") -> datetime:
     """
     CGT -> datetime in an IANA timezone.
     Example tz_name: 'America/Los_Angeles' (PT; PST/PDT automatically).
+    None, 'UTC' and 'Etc/UTC' return the UTC datetime as-is (tzinfo=timezone.utc).
     """
     dt_utc = cgt_to_datetime_utc(cgt, mode=mode)
-    return dt_utc.astimezone(ZoneInfo(tz_name))
+    if tz_name is None or tz_name in _UTC_TZ_NAMES:
+        return dt_utc
+    return dt_utc.astimezone(_zi(tz_name))
 
 
 def timezone_to_cgt(
@@ -156,7 +242,7 @@ def timezone_to_cgt(
     mode: EpochMode = "current",
 ) -> CGT:
     """Local clock fields in tz_name -> CGT."""
-    tz = ZoneInfo(tz_name)
+    tz = _zi(tz_name)
     dt_local = datetime(year, month, day, hour, minute, second, tzinfo=tz)
     return datetime_to_cgt(dt_local, mode=mode)
 
@@ -171,11 +257,89 @@ def datetime_to_swet(dt: datetime) -> int:
     - If dt is timezone-aware, converted to UTC.
     - If dt is naive, treated as UTC.
     """
-    if dt.tzinfo is None:
-        dt_utc = dt.replace(tzinfo=timezone.utc)
-    else:
-        dt_utc = dt.astimezone(timezone.utc)
-    return int(dt_utc.timestamp()) - STAR_WARS_RELEASE_UNIX
+    return unix_to_swet(_unix_seconds(dt))
+
+
+def unix_to_swet(unix: int) -> int:
+    """Unix seconds -> SWET seconds (skips datetime handling entirely)."""
+    return unix - STAR_WARS_RELEASE_UNIX
+
+
+def _require_numpy():
+    global _np
+    if _np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("numpy is required for the sw_time *_array helpers") from None
+        _np = numpy
+    return _np
+
+
+def unix_to_swet_array(unix_seconds):
+    """
+    Batch unix_to_swet: array of Unix seconds -> int64 array of SWET seconds.
+    One vectorized subtraction instead of a Python call per timestamp.
+    """
+    np = _require_numpy()
+    return np.asarray(unix_seconds, dtype=np.int64) - STAR_WARS_RELEASE_UNIX
+
+
+def swet_array_to_datetime64(swet):
+    """Batch swet_to_datetime_utc: array of SWET seconds -> datetime64[s] (UTC) array."""
+    np = _require_numpy()
+    unix = np.asarray(swet, dtype=np.int64) + STAR_WARS_RELEASE_UNIX
+    return unix.astype("datetime64[s]")
+
+
+# Batch CGT kernel for unix_to_cgt_array, built on first use.
+_cgt_fields_kernel = None
+
+
+def _build_cgt_fields_kernel():
+    """
+    (cgt_seconds, out) -> None, filling out[i] with the CGT fields of
+    cgt_seconds[i]. numba (imported here, not at module import) compiles a loop
+    over the scalar core when installed; otherwise numpy's divmod does it.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        np = _require_numpy()
+
+        def fill(cgt_seconds, out):
+            t, out[:, 4] = np.divmod(cgt_seconds, SECONDS_PER_MINUTE)
+            t, out[:, 3] = np.divmod(t, 60)
+            t, out[:, 2] = np.divmod(t, 24)
+            out[:, 0], out[:, 1] = np.divmod(t, DAYS_PER_CGT_YEAR)
+            out[:, 1] += 1
+
+        return fill
+
+    # cache=True keeps the compiled code on disk across process starts.
+    core = njit(cache=True)(_py_cgt_fields_from_seconds)
+
+    @njit(cache=True)
+    def fill(cgt_seconds, out):
+        for i in range(cgt_seconds.shape[0]):
+            out[i, 0], out[i, 1], out[i, 2], out[i, 3], out[i, 4] = core(cgt_seconds[i])
+
+    return fill
+
+
+def unix_to_cgt_array(unix_seconds, mode: EpochMode = "current"):
+    """
+    Batch unix_to_cgt: array of Unix seconds -> (n, 5) int64 array of
+    (year, day, hour, minute, second) rows.
+    """
+    global _cgt_fields_kernel
+    np = _require_numpy()
+    cgt_seconds = np.asarray(unix_seconds, dtype=np.int64).ravel() - _epoch_offset(mode)
+    if _cgt_fields_kernel is None:
+        _cgt_fields_kernel = _build_cgt_fields_kernel()
+    out = np.empty((cgt_seconds.shape[0], 5), dtype=np.int64)
+    _cgt_fields_kernel(cgt_seconds, out)
+    return out
 
 
 def swet_to_datetime_utc(swet: int) -> datetime:
@@ -185,20 +349,24 @@ def swet_to_datetime_utc(swet: int) -> datetime:
 
 def cgt_to_swet(cgt: CGT, mode: EpochMode = "current") -> int:
     """CGT -> SWET seconds."""
-    return datetime_to_swet(cgt_to_datetime_utc(cgt, mode=mode))
+    return unix_to_swet(cgt_to_unix(cgt, mode=mode))
 
 
 def swet_to_cgt(swet: int, mode: EpochMode = "current") -> CGT:
     """SWET seconds -> CGT."""
-    return datetime_to_cgt(swet_to_datetime_utc(swet), mode=mode)
+    return unix_to_cgt(swet + STAR_WARS_RELEASE_UNIX, mode=mode)
 
 
 # -----------------------------
 # Pretty formatting helpers
 # -----------------------------
 
+# Bound once at import; format_cgt is called for every stamped payload.
+_CGT_FMT = "CGT {:02d} {:03d} {:02d}:{:02d}:{:02d}".format
+
+
 def format_cgt(cgt: CGT) -> str:
-    return f"CGT {cgt.year:02d} {cgt.day:03d} {cgt.hour:02d}:{cgt.minute:02d}:{cgt.second:02d}"
+    return _CGT_FMT(cgt.year, cgt.day, cgt.hour, cgt.minute, cgt.second)
 
 
 def format_dt(dt: datetime) -> str:
@@ -211,13 +379,27 @@ def format_dt(dt: datetime) -> str:
 # Note: these are YEAR conversions only (no months/days).
 # -----------------------------
 
+# 0 GSC == 25043 BBY  => BBY = GSC - 25043
+# Exposed so hot paths can add it inline instead of calling bby_to_gsc().
+GSC_OFFSET = 25043
+
+
 def gsc_to_bby(gsc: float) -> float:
-    # 0 GSC == 25043 BBY  => BBY = GSC - 25043
-    return gsc - 25043
+    return gsc - GSC_OFFSET
 
 
 def bby_to_gsc(bby: float) -> float:
-    return bby + 25043
+    return bby + GSC_OFFSET
+
+
+def gsc_to_bby_array(gsc):
+    """Batch gsc_to_bby over an array of years (one vectorized subtraction)."""
+    return _require_numpy().asarray(gsc) - GSC_OFFSET
+
+
+def bby_to_gsc_array(bby):
+    """Batch bby_to_gsc over an array of years (one vectorized addition)."""
+    return _require_numpy().asarray(bby) + GSC_OFFSET
 
 
 def btc_to_bby(btc: float) -> float:
@@ -35,9 +35,9 @@ class TestHolonetStamp(unittest.TestCase):
             epoch_mode="current",
             request_id="web-req-1",
         )
-        self.assertEqual(payload["fact"], "Han shot first.")
-        self.assertEqual(payload["request_id"], "web-req-1")
-        self.assertEqual(payload["x_request_id"], "web-req-1")
+        self.assertEqual(payload.fact, "Han shot first.")
+        self.assertEqual(payload.request_id, "web-req-1")
+        self.assertEqual(payload.x_request_id, "web-req-1")
 
     def test_one_line_contains_rid_and_fact(self):
         fixed = datetime(2025, 12, 31, 22, 18, 23, tzinfo=timezone.utc)
@@ -58,8 +58,11 @@ class TestHolonetStamp(unittest.TestCase):
         fixed = datetime(2025, 12, 31, 22, 18, 23, tzinfo=timezone.utc)
         p1 = build_payload(fixed, "America/Los_Angeles", include_sw=False, epoch_mode="current", request_id="x")
         p2 = build_payload(fixed, "America/Los_Angeles", include_sw=True, epoch_mode="current", request_id="x")
-        self.assertNotIn("sw", p1)
-        self.assertIn("sw", p2)
+        self.assertIsNone(p1.sw)
+        self.assertIsNotNone(p2.sw)
+        # the JSON shape only carries the sw block when enabled
+        self.assertNotIn("sw", p1.to_dict())
+        self.assertIn("sw", p2.to_dict())
 
     def test_auto_prefix_api_when_json(self):
         args = DummyArgs(json=True, quiet=False, one_line=False, request_id=None, rid_prefix=None)
@@ -90,11 +93,33 @@ class TestHolonetStamp(unittest.TestCase):
             else:
                 os.environ["HTTP_X_REQUEST_ID"] = old
 
+    def test_known_prefix_not_double_prefixed(self):
+        args = DummyArgs(json=True, request_id="curl-abc", rid_prefix=None)
+        rid = holonet_stamp._final_request_id(args)
+        self.assertEqual(rid, "curl-abc")
+
+    def test_explicit_prefix_applies_to_known_prefixed_id(self):
+        args = DummyArgs(json=True, request_id="web-123", rid_prefix="svc")
+        rid = holonet_stamp._final_request_id(args)
+        self.assertEqual(rid, "svc-web-123")
+
     def test_cli_request_id_gets_prefixed_if_missing_prefix(self):
         args = DummyArgs(json=True, request_id="123", rid_prefix="api-")
         rid = holonet_stamp._final_request_id(args)
         self.assertEqual(rid, "api-123")
 
+    def test_cli_request_id_wins_over_inbound_env(self):
+        old = os.environ.get("HTTP_X_REQUEST_ID")
+        try:
+            os.environ["HTTP_X_REQUEST_ID"] = "curl-abc"
+            args = DummyArgs(json=True, request_id="123", rid_prefix=None)
+            self.assertEqual(holonet_stamp._final_request_id(args), "api-123")
+        finally:
+            if old is None:
+                os.environ.pop("HTTP_X_REQUEST_ID", None)
+            else:
+                os.environ["HTTP_X_REQUEST_ID"] = old
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
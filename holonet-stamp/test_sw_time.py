@@ -1,6 +1,11 @@
 import unittest
 from datetime import datetime, timezone
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from sw_time import (
     CGT,
     cgt_to_datetime_utc,
@@ -8,10 +13,17 @@ from sw_time import (
     cgt_to_timezone,
     datetime_to_swet,
     swet_to_datetime_utc,
+    unix_to_cgt,
+    unix_to_cgt_array,
+    unix_to_swet,
+    unix_to_swet_array,
+    swet_array_to_datetime64,
     STAR_WARS_RELEASE_UTC,
     STAR_WARS_RELEASE_UNIX,
     bby_to_gsc,
     gsc_to_bby,
+    bby_to_gsc_array,
+    gsc_to_bby_array,
 )
 
 
@@ -44,6 +56,19 @@ class TestStarWarsTime(unittest.TestCase):
         back = datetime_to_cgt(dt, mode="legacy")
         self.assertEqual(back, original)
 
+    def test_cgt_replace_validates_fields(self):
+        cgt = CGT(0, 1, 0, 0, 0)
+        self.assertEqual(cgt._replace(hour=5), CGT(0, 1, 5, 0, 0))
+        with self.assertRaises(ValueError):
+            cgt._replace(day=999)
+        with self.assertRaises(ValueError):
+            CGT._make((0, 1, 24, 0, 0))
+
+    def test_unix_to_cgt_matches_datetime_to_cgt(self):
+        dt = datetime(2025, 12, 31, 22, 18, 23, tzinfo=timezone.utc)
+        for mode in ("current", "legacy"):
+            self.assertEqual(unix_to_cgt(int(dt.timestamp()), mode=mode), datetime_to_cgt(dt, mode=mode))
+
     def test_cgt_timezone_conversion_pt(self):
         # Ensure tz conversion is consistent with UTC for the same instant.
         cgt = CGT(0, 1, 0, 0, 0)
@@ -56,6 +81,14 @@ class TestStarWarsTime(unittest.TestCase):
             datetime(1998, 12, 3, 7, 0, 0, tzinfo=timezone.utc),
         )
 
+    def test_cgt_timezone_conversion_utc_fast_path(self):
+        cgt = CGT(0, 1, 0, 0, 0)
+        expected = datetime(1998, 12, 3, 7, 0, 0, tzinfo=timezone.utc)
+        for tz_name in (None, "UTC", "Etc/UTC"):
+            dt = cgt_to_timezone(cgt, tz_name, mode="current")
+            self.assertEqual(dt, expected)
+            self.assertIs(dt.tzinfo, timezone.utc)
+
     # -----------------
     # SWET tests
     # -----------------
@@ -74,6 +107,28 @@ class TestStarWarsTime(unittest.TestCase):
         swet = datetime_to_swet(dt)
         self.assertEqual(swet_to_datetime_utc(swet), dt)
 
+    def test_unix_to_swet_matches_datetime_to_swet(self):
+        dt = datetime(2025, 12, 31, 22, 18, 23, tzinfo=timezone.utc)
+        self.assertEqual(unix_to_swet(int(dt.timestamp())), datetime_to_swet(dt))
+        self.assertEqual(unix_to_swet(STAR_WARS_RELEASE_UNIX), 0)
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_swet_array_roundtrip(self):
+        unix = np.array([0, STAR_WARS_RELEASE_UNIX, 1_767_219_503], dtype=np.int64)
+        swet = unix_to_swet_array(unix)
+        self.assertEqual(swet.tolist(), [unix_to_swet(int(u)) for u in unix])
+        self.assertEqual(
+            swet_array_to_datetime64(swet).tolist(),
+            [swet_to_datetime_utc(int(s)).replace(tzinfo=None) for s in swet],
+        )
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_unix_to_cgt_array_matches_scalar(self):
+        unix = np.array([0, STAR_WARS_RELEASE_UNIX, 912_668_399, 1_767_219_503], dtype=np.int64)
+        for mode in ("current", "legacy"):
+            rows = unix_to_cgt_array(unix, mode=mode).tolist()
+            self.assertEqual([tuple(r) for r in rows], [unix_to_cgt(int(u), mode=mode) for u in unix])
+
     def test_star_wars_release_to_cgt_current(self):
         # This pins down the specific CGT decomposition for the chosen SWET epoch moment.
         # Star Wars Release (1977-05-25 00:00:00 UTC) -> CGT (current mode)
@@ -91,6 +146,12 @@ class TestStarWarsTime(unittest.TestCase):
         self.assertEqual(gsc_to_bby(0), -25043)
         self.assertEqual(bby_to_gsc(0), 25043)
 
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_gsc_bby_array_offsets(self):
+        years = np.array([-22, 0, 1234])
+        self.assertEqual(bby_to_gsc_array(years).tolist(), [bby_to_gsc(int(y)) for y in years])
+        self.assertEqual(gsc_to_bby_array(bby_to_gsc_array(years)).tolist(), years.tolist())
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,160 @@
+import gzip
+import json
+import threading
+import types
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import app
+
+
+class TestQuoteCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        self.fetched = []
+        self.responses = []
+        # Only app.py sees the fake clock; time.monotonic itself is untouched.
+        clock = types.SimpleNamespace(monotonic=lambda: self.now)
+        for patcher in (
+            mock.patch.object(app, "time", clock),
+            mock.patch.object(app, "_fetch_quote", self._fake_fetch),
+            mock.patch.dict(app._quote_cache, quote=None, expires=0.0),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _fake_fetch(self, url, request_id, timeout_s):
+        self.fetched.append(request_id)
+        return self.responses.pop(0)
+
+    def test_quote_reused_within_ttl(self):
+        self.responses = ["first", "second"]
+        self.assertEqual(app.get_cached_quote("r1"), "first")
+        self.now += app.QUOTE_TTL_S - 1
+        self.assertEqual(app.get_cached_quote("r2"), "first")
+        self.assertEqual(self.fetched, ["r1"])
+
+        self.now += 1
+        self.assertEqual(app.get_cached_quote("r3"), "second")
+        self.assertEqual(self.fetched, ["r1", "r3"])
+
+    def test_stale_quote_served_when_refresh_fails(self):
+        self.responses = ["first", None]
+        app.get_cached_quote("r1")
+        self.now += app.QUOTE_TTL_S
+        self.assertEqual(app.get_cached_quote("r2"), "first")
+
+    def test_failed_fetch_backs_off_for_ttl(self):
+        self.responses = [None, "late"]
+        self.assertIsNone(app.get_cached_quote("r1"))
+        self.now += app.QUOTE_TTL_S - 1
+        self.assertIsNone(app.get_cached_quote("r2"))
+        self.assertEqual(self.fetched, ["r1"])
+
+        self.now += 1
+        self.assertEqual(app.get_cached_quote("r3"), "late")
+
+    def test_stale_quote_served_while_another_thread_refreshes(self):
+        app._quote_cache.update(quote="stale", expires=0.0)
+        with app._quote_lock:
+            # Run in another thread: a blocking acquire would deadlock here.
+            result = []
+            t = threading.Thread(target=lambda: result.append(app.get_cached_quote("r1")))
+            t.start()
+            t.join(timeout=1.0)
+            self.assertFalse(t.is_alive())
+        self.assertEqual(result, ["stale"])
+        self.assertEqual(self.fetched, [])
+
+    def test_no_quote_yet_does_not_wait_on_refresh(self):
+        with app._quote_lock:
+            result = []
+            t = threading.Thread(target=lambda: result.append(app.get_cached_quote("r1")))
+            t.start()
+            t.join(timeout=1.0)
+            self.assertFalse(t.is_alive())
+        self.assertEqual(result, [None])
+        self.assertEqual(self.fetched, [])
+
+
+class TestWebRequestId(unittest.TestCase):
+    def setUp(self):
+        self.forwarded = []
+        for patcher in (
+            mock.patch.object(app, "_fetch_quote", self._fake_fetch),
+            mock.patch.dict(app._quote_cache, quote=None, expires=0.0),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = app.app.test_client()
+
+    def _fake_fetch(self, url, request_id, timeout_s):
+        self.forwarded.append(request_id)
+        return None
+
+    def _request_id(self, header=None):
+        headers = {} if header is None else {"X-Request-ID": header}
+        resp = self.client.get("/api/v1/greedo", headers=headers)
+        self.assertEqual(resp.status_code, 200)
+        return resp.get_json()["request_id"]
+
+    def test_bare_id_gets_prefixed(self):
+        self.assertEqual(self._request_id("abc"), "api-abc")
+        self.assertEqual(self.forwarded, ["api-abc"])
+
+    def test_known_prefix_kept(self):
+        self.assertEqual(self._request_id("web-abc"), "web-abc")
+
+    def test_generated_id_shape(self):
+        rid = self._request_id()
+        self.assertRegex(rid, r"^api-[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+
+    def test_whitespace_header_falls_back_to_generated(self):
+        self.assertRegex(self._request_id("   "), r"^api-[0-9a-f]{8}-")
+
+    def test_unsafe_or_long_header_not_reflected(self):
+        for header in ("a b", "<script>", "x" * 129):
+            rid = self._request_id(header)
+            self.assertNotIn(header, rid)
+            self.assertRegex(rid, r"^api-[0-9a-f]{8}-")
+        self.assertEqual(self._request_id("x" * 128), "api-" + "x" * 128)
+
+
+class TestPrecomputedBodies(unittest.TestCase):
+    def setUp(self):
+        self.client = app.app.test_client()
+
+    def test_openapi_gzip_matches_identity(self):
+        plain = self.client.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+        gz = self.client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+
+        self.assertIsNone(plain.headers.get("Content-Encoding"))
+        self.assertEqual(gz.headers.get("Content-Encoding"), "gzip")
+        for resp in (plain, gz):
+            self.assertEqual(resp.status_code, 200)
+            self.assertIn("Accept-Encoding", resp.headers.get("Vary", ""))
+        self.assertEqual(gzip.decompress(gz.data), plain.data)
+
+        spec = json.loads(plain.data)
+        self.assertEqual(spec["servers"][0]["url"], app.OPENAPI_SERVER_URL)
+        self.assertIn("/api/v1/greedo", spec["paths"])
+
+    def test_openapi_ignores_host_header(self):
+        a = self.client.get("/openapi.json", headers={"Host": "a.example"})
+        b = self.client.get("/openapi.json", headers={"Host": "b.example"})
+        self.assertEqual(a.data, b.data)
+
+    def test_api_health_json(self):
+        resp = self.client.get("/api/health")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.mimetype, "application/json")
+        data = resp.get_json()
+        self.assertEqual(data["status"], "healthy")
+        self.assertEqual(data["fact"], app.DEFAULT_FACT)
+        self.assertNotEqual(data["timestamp"], app._HEALTH_TIMESTAMP)
+        datetime.fromisoformat(data["timestamp"])
+
+
+if __name__ == "__main__":
+    unittest.main()